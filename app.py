@@ -1,14 +1,29 @@
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
+import networkx as nx
 import plotly.express as px
 import os
+import re
+import hashlib
+import posixpath
+import zipfile
+import tempfile
+import time
+import xml.etree.ElementTree as ET
 from datetime import date
-from openpyxl import load_workbook
+from openpyxl.utils import range_boundaries
 from pyvis.network import Network
-import tempfile
 import streamlit.components.v1 as components
 import json
+from typing import NamedTuple
+
+# Prefer the Rust-backed calamine engine for parsing; fall back to openpyxl if missing
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
 
 # ------------------------------------------
 #         CONSTANTS / FILE REFERENCES
@@ -16,70 +31,271 @@ import json
 FILE_NAME = "VCR - All Enacted Law & Legislative Tracker.xlsx"
 SHEET_NAME = "Enacted Federal Law (Ex. J.Res."
 DEFAULT_AUTHOR_NAME = "Sullivan"  # Adjust if your data uses a different string
+CACHE_DIR = ".cache"  # Parsed copies of the spreadsheet, keyed by content hash
+CACHE_VERSION = 7  # Bump whenever the output of load_data() changes
+CACHE_FILE_PATTERN = re.compile(r"[0-9a-f]{32}-v\d+\.parquet")  # Names load_data() writes
+CACHE_TMP_SUFFIX = ".parquet.tmp"  # In-progress cache writes
+STALE_TMP_SECONDS = 3600  # Leftover temp files older than this are swept
+MAX_ANNOTATED_POINTS = 200  # Above this, per-point title annotations are skipped
+MAX_TIMELINE_BARS = 1000  # Above this, the timeline switches to monthly counts
+MAX_SCATTER_POINTS = 5000  # Above this, the basic scatter plots weekly counts by default
+MAX_TABLE_ROWS = 1000  # Results tables only send this many rows to the browser
+MAX_LAYOUT_NODES = 1000  # Above this, the network graph uses browser physics instead of a precomputed layout
+VIEW_COLUMNS = ["Date", "Year", "Policy Area", "Author", "Enactment Method", "Title", "Link"]
+URL_PATTERN = re.compile(r"https?://\S+")  # URLs embedded in the title/link text
+LINK_COLUMN = 4  # 1-based column index of "Current Link (Inc. Amndt, if applicable)"
+
+# XML namespaces used inside the XLSX package
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+NS_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 
 # ==========================================
 #         DATA LOADING & PREP
 # ==========================================
-@st.cache_data
-def load_data() -> pd.DataFrame:
+def file_hash(path: str) -> str:
+    """
+    Returns a short content hash of the file, used to key the on-disk cache.
+    """
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def read_relationships(zf: zipfile.ZipFile, part: str) -> dict:
+    """
+    Returns {relationship id: target} for a .rels part (empty if it doesn't exist).
+    """
+    if part not in zf.namelist():
+        return {}
+    root = ET.fromstring(zf.read(part))
+    return {rel.get("Id"): rel.get("Target") for rel in root.iter(f"{{{NS_PKG_REL}}}Relationship")}
+
+def read_hyperlinks(path: str, sheet_name: str, column: int, n_rows: int) -> list:
+    """
+    Returns the hyperlink target (or None) for each data row of one column.
+
+    Reads the sheet's <hyperlinks> block and its .rels file directly from the
+    XLSX zip, so the work scales with the number of links, not cells.
+    """
+    links = [None] * n_rows
+    with zipfile.ZipFile(path) as zf:
+        # Resolve the worksheet part from its display name via workbook.xml
+        workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+        sheet_rid = next(
+            sheet.get(f"{{{NS_DOC_REL}}}id")
+            for sheet in workbook.iter(f"{{{NS_MAIN}}}sheet")
+            if sheet.get("name") == sheet_name
+        )
+        target = read_relationships(zf, "xl/_rels/workbook.xml.rels")[sheet_rid]
+        sheet_part = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+        folder, part_name = posixpath.split(sheet_part)
+        link_targets = read_relationships(zf, f"{folder}/_rels/{part_name}.rels")
+
+        with zf.open(sheet_part) as f:
+            for _, elem in ET.iterparse(f):
+                if elem.tag == f"{{{NS_MAIN}}}hyperlink":
+                    url = link_targets.get(elem.get(f"{{{NS_DOC_REL}}}id"))
+                    min_col, min_row, max_col, max_row = range_boundaries(elem.get("ref"))
+                    if url and min_col <= column <= max_col:
+                        # Row 1 is the header, so sheet row r is data row r - 2
+                        for r in range(max(min_row, 2), min(max_row, n_rows + 1) + 1):
+                            links[r - 2] = url
+                elif elem.tag == f"{{{NS_MAIN}}}row":
+                    elem.clear()  # cell values aren't needed; keep memory flat
+    return links
+
+def file_mtime(path: str) -> float:
+    """
+    Returns the file's modification time (0.0 if it's missing). Passed to the
+    cached loaders so that editing the spreadsheet invalidates them.
+    """
+    return os.path.getmtime(path) if os.path.exists(path) else 0.0
+
+def remove_file(path: str):
+    """
+    Deletes a file, ignoring errors (it may already be gone or be read-only).
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def write_cache(df: pd.DataFrame, cache_path: str):
+    """
+    Stores the cleaned data as parquet at `cache_path`, then removes this
+    app's older cache files (earlier spreadsheet versions or CACHE_VERSIONs)
+    and temp files left behind by interrupted writes.
+
+    The file is written under a temporary name and moved into place, so an
+    interrupted write never leaves a truncated cache behind. The disk cache
+    is best-effort: if it can't be written, loading still succeeds.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=CACHE_TMP_SUFFIX)
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, cache_path)
+        finally:
+            remove_file(tmp_path)  # no-op once replaced
+    # pyarrow's ArrowInvalid / ArrowNotImplementedError subclass ValueError / NotImplementedError
+    except (OSError, ValueError, TypeError, NotImplementedError):
+        return
+
+    now = time.time()
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        if CACHE_FILE_PATTERN.fullmatch(name) and path != cache_path:
+            remove_file(path)
+        elif name.endswith(CACHE_TMP_SUFFIX):
+            try:
+                # Old enough that no other process can still be writing it
+                if now - os.path.getmtime(path) > STALE_TMP_SECONDS:
+                    remove_file(path)
+            except OSError:
+                pass
+
+@st.cache_data(show_spinner="Loading legislation...")
+def load_data(mtime: float) -> pd.DataFrame:
     """
     Load, clean, and structure the spreadsheet data.
+
+    `mtime` is the spreadsheet's modification time and only serves as the
+    cache key. The cleaned result is also stored as parquet under CACHE_DIR,
+    so later runs against the same spreadsheet skip the Excel parse entirely.
     """
     if not os.path.exists(FILE_NAME):
         st.error(f"File '{FILE_NAME}' not found in the current directory.")
         return pd.DataFrame()
 
-    # Load data from Excel
-    df = pd.read_excel(FILE_NAME, sheet_name=SHEET_NAME, engine="openpyxl")
-
-    # Keep specific columns and rename for readability
-    df = df[
-        [
-            "Author(s)",
-            "Original Introduction Date:",
-            "Main policy topic",
-            "Current Link (Inc. Amndt, if applicable)",
-            "Method of Enactment",
-        ]
-    ].copy()
+    # Reuse a previously parsed copy of this exact file if we have one
+    cache_path = os.path.join(CACHE_DIR, f"{file_hash(FILE_NAME)}-v{CACHE_VERSION}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            # Truncated or corrupt cache file: drop it and re-parse the spreadsheet
+            remove_file(cache_path)
+
+    # Load only the columns we use from Excel, in this order, and rename for readability
+    source_columns = [
+        "Author(s)",
+        "Original Introduction Date:",
+        "Main policy topic",
+        "Current Link (Inc. Amndt, if applicable)",
+        "Method of Enactment",
+    ]
+    df = pd.read_excel(FILE_NAME, sheet_name=SHEET_NAME, engine=EXCEL_ENGINE, usecols=source_columns)
+    df = df[source_columns]
     df.columns = ["Authors", "Date", "Policy Area", "Title and Link", "Enactment Method"]
 
     # Convert Date column to datetime
     df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
 
-    # Use openpyxl to extract actual hyperlink targets from the relevant column
-    workbook = load_workbook(FILE_NAME)
-    sheet = workbook[SHEET_NAME]
-    links = []
-    for row in sheet.iter_rows(min_row=2, max_row=sheet.max_row, min_col=4, max_col=4):
-        cell = row[0]
-        links.append(cell.hyperlink.target if cell.hyperlink else None)
-
+    # Pull actual hyperlink targets for the link column straight from the sheet XML
+    links = read_hyperlinks(FILE_NAME, SHEET_NAME, LINK_COLUMN, len(df))
     df["Link"] = links
 
     # Extract plain text for "Title" by removing embedded URLs from the string
-    df["Title"] = df["Title and Link"].str.replace(r"http[^\s]+", "", regex=True).str.strip()
+    df["Title"] = df["Title and Link"].str.replace(URL_PATTERN, "", regex=True).str.strip()
 
-    # Explode authors by comma to facilitate filtering (e.g., "Sen. A, Sen. B" -> 2 rows)
-    df = df.assign(Author=df["Authors"].str.split(",")).explode("Author")
-    df["Author"] = df["Author"].str.strip()  # remove extra spaces
+    # Explode authors by comma to facilitate filtering (e.g., "Sen. A, Sen. B" -> 2 rows).
+    # Only the author lists are exploded; the other columns are gathered once by row index.
+    # The raw "Authors" and "Title and Link" columns are dropped; nothing reads them after this.
+    authors = df["Authors"].str.split(",").explode()
+    df = df.drop(columns=["Authors", "Title and Link"])
+    df = df.loc[authors.index].assign(Author=authors.str.strip().to_numpy())  # remove extra spaces
+    df = df.reset_index(drop=True)
+
+    # Low-cardinality text columns: store as categories (int codes) for cheaper
+    # filtering, grouping and caching. Parquet round-trips the dtype.
+    for col in ["Author", "Policy Area", "Enactment Method"]:
+        df[col] = df[col].astype("category")
+
+    # Free-text columns: Arrow-backed strings (one contiguous UTF-8 buffer per
+    # column) on any pandas version, rather than Python objects. Missing
+    # values are pd.NA.
+    for col in ["Title", "Link"]:
+        df[col] = df[col].astype("string[pyarrow]")
+
+    write_cache(df, cache_path)
 
     return df
 
 @st.cache_data
-def get_filtered_data() -> pd.DataFrame:
+def get_filtered_data(mtime: float) -> pd.DataFrame:
     """
-    Returns the cleaned data with valid dates only.
+    Returns the cleaned data with valid dates only, plus a "Year" column.
+    Rows are sorted by Date so date ranges can be sliced with searchsorted.
     """
-    data = load_data()
+    data = load_data(mtime)
     if not data.empty:
         # Drop rows with no valid Date
-        data = data.dropna(subset=["Date"]).reset_index(drop=True)
+        data = data.dropna(subset=["Date"]).sort_values("Date", kind="stable").reset_index(drop=True)
+        data["Year"] = data["Date"].dt.year.astype("int16")
+    return data
+
+class FilterOptions(NamedTuple):
+    """
+    Choices offered by the filter widgets.
+    """
+    authors: list
+    policy_areas: list
+    methods: list
+    min_date: date
+    max_date: date
+
+@st.cache_data(show_spinner=False)
+def get_filter_options(mtime: float) -> FilterOptions:
+    """
+    Returns the sorted filter choices and date bounds for get_filtered_data().
+    Cached, so widget interactions don't rescan the data.
+    """
+    data = get_filtered_data(mtime)
+    return FilterOptions(
+        authors=sorted(data["Author"].dropna().unique()),
+        policy_areas=sorted(data["Policy Area"].dropna().unique()),
+        methods=sorted(data["Enactment Method"].dropna().unique()),
+        min_date=data["Date"].min().date(),
+        max_date=data["Date"].max().date(),
+    )
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def apply_filters(
+    mtime: float,
+    authors: tuple,
+    policy_areas: tuple,
+    methods: tuple,
+    start_date: date,
+    end_date: date,
+) -> pd.DataFrame:
+    """
+    Returns the rows of get_filtered_data() matching the given filters.
+
+    An empty tuple means "no restriction" for that column. Cached on the
+    filter values, so reruns that only touch other widgets reuse the slice;
+    only the most recent filter combinations are kept.
+    """
+    data = get_filtered_data(mtime)
+
+    # Data is sorted by Date, so the (inclusive) date range is one contiguous slice
+    lo = data["Date"].searchsorted(pd.Timestamp(start_date), side="left")
+    hi = data["Date"].searchsorted(pd.Timestamp(end_date), side="right")
+    data = data.iloc[lo:hi]
+
+    # The remaining filters only run on the rows inside the date range
+    if authors:
+        data = data[data["Author"].isin(authors)]
+    if policy_areas:
+        data = data[data["Policy Area"].isin(policy_areas)]
+    if methods:
+        data = data[data["Enactment Method"].isin(methods)]
     return data
 
 # ==========================================
 #         HELPER FUNCTIONS
 # ==========================================
+@st.cache_data(show_spinner=False, max_entries=16)
 def generate_scatter_plot(
     data: pd.DataFrame,
     x_col: str,
@@ -92,15 +308,18 @@ def generate_scatter_plot(
     """
     Generates a scatter plot with:
       - Hover info (including Method of Enactment).
-      - Annotations that create clickable links (if annotate_points=True).
+      - Annotations that create clickable links (if annotate_points=True
+        and there are at most MAX_ANNOTATED_POINTS points).
+      - WebGL rendering, so large selections stay responsive.
       - Consistent styling.
+    Cached, so reruns with the same data and options reuse the figure.
     """
     fig = px.scatter(
         data,
         x=x_col,
         y=y_col,
         color=color_col,
-        size=[10] * len(data),  # fixed orb size
+        render_mode="webgl",
         hover_name="Title",
         hover_data={
             "Date": True,
@@ -116,6 +335,8 @@ def generate_scatter_plot(
         },
         title=title,
     )
+    # Fixed orb size (~the diameter px gave the old constant size column)
+    fig.update_traces(marker=dict(size=14))
     fig.update_layout(
         autosize=True,
         height=700,
@@ -123,34 +344,49 @@ def generate_scatter_plot(
         margin=dict(l=40, r=40, t=80, b=40),
     )
 
-    # Optionally add clickable annotations for each data point
-    if annotate_points:
-        for i, row in data.iterrows():
-            link = row.get("Link", None)
-            x_val = row[x_col]
-            y_val = row[y_col]
-            title_text = row["Title"] or ""
-
-            if pd.notna(link):
-                annotation_text = f'<a href="{link}" target="_blank">{title_text}</a>'
-            else:
-                annotation_text = title_text  # no link if missing
-
-            if annotation_text.strip():
-                fig.add_annotation(
-                    x=x_val,
-                    y=y_val,
-                    text=annotation_text,
-                    showarrow=False,
-                    yshift=10,  # shift label upward
-                    font=dict(size=text_size - 2, color="blue"),
-                )
+    # Optionally add clickable annotations for each data point; past the
+    # threshold they cost more in browser layout than they add in legibility
+    if annotate_points and len(data) <= MAX_ANNOTATED_POINTS:
+        # Label text for every point, built column-wise (no link if missing);
+        # points without a title get no label
+        titles = data["Title"].fillna("")
+        texts = titles.where(
+            data["Link"].isna(),
+            '<a href="' + data["Link"] + '" target="_blank">' + titles + "</a>",
+        )
+        labeled = (titles.str.strip() != "").to_numpy(dtype=bool)
+
+        # Build every annotation up front and assign them in one layout update
+        annotations = [
+            dict(
+                x=x_val,
+                y=y_val,
+                text=text,
+                showarrow=False,
+                yshift=10,  # shift label upward
+                font=dict(size=text_size - 2, color="blue"),
+            )
+            for x_val, y_val, text in zip(
+                data[x_col].to_numpy()[labeled],
+                data[y_col].to_numpy()[labeled],
+                texts.to_numpy()[labeled],
+            )
+        ]
+        fig.update_layout(annotations=annotations)
 
     return fig
 
+def slim_frame(df: pd.DataFrame, cols: list) -> pd.DataFrame:
+    """
+    Returns just `cols` of `df` with a fresh index, so unused columns aren't
+    serialized to the browser by plots and tables.
+    """
+    return df.loc[:, cols].reset_index(drop=True)
+
 def display_results_table(df: pd.DataFrame):
     """
     Displays a summary and a nicely formatted table of the filtered results.
+    Only the first MAX_TABLE_ROWS rows are sent to the browser.
     """
     count = len(df)
     st.write(f"**Total matching records:** {count}")
@@ -163,7 +399,9 @@ def display_results_table(df: pd.DataFrame):
             "Title",
             "Link",
         ]
-        st.dataframe(df[columns_to_show].reset_index(drop=True))
+        st.dataframe(slim_frame(df.head(MAX_TABLE_ROWS), columns_to_show), hide_index=True)
+        if count > MAX_TABLE_ROWS:
+            st.caption(f"Showing the first {MAX_TABLE_ROWS} of {count} rows. Narrow your filters to see the rest.")
     else:
         st.info("No records match your selection.")
 
@@ -174,71 +412,107 @@ def create_network_graph(data: pd.DataFrame) -> Network:
     showing relationships (Author -> Bill, Bill -> Policy Area).
 
     CHANGE: Added the Bill's Date to the node tooltip.
+    CHANGE: For graphs of up to MAX_LAYOUT_NODES nodes, positions are
+    precomputed with ForceAtlas2 in Python and browser physics is off, so
+    they render without stabilizing. networkx's ForceAtlas2 is quadratic in
+    time and memory, so bigger graphs fall back to PyVis browser physics.
     """
     net = Network(height="700px", width="100%", bgcolor="#222222", font_color="white")
-    net.force_atlas_2based()  # More stable
-
-    added_nodes = set()
 
-    for idx, row in data.iterrows():
-        bill_title = row["Title"]
-        author = row["Author"]
-        policy_area = row["Policy Area"]
-        link = row.get("Link", None)
+    # Blank / missing authors and policy areas get no node or edge
+    has_author = data["Author"].notna() & (data["Author"] != "")
+    has_policy = data["Policy Area"].notna() & (data["Policy Area"] != "")
+
+    # Bill tooltips, built column-wise; the first row for each title supplies
+    # the date (shown in the tooltip) and the link. Rows arrive sorted by Date
+    # (see get_filtered_data), so for a title listed more than once this is
+    # its earliest-dated row, not its first row in the spreadsheet.
+    bills = data.drop_duplicates("Title")
+    bill_titles = bills["Title"]
+    date_strs = bills["Date"].dt.strftime("%Y-%m-%d").fillna("N/A")
+    bill_tips = "<b>Bill</b>: " + bill_titles + "<br>Date: " + date_strs
+    has_link = bills["Link"].notna() & (bills["Link"] != "")
+    bill_tips = bill_tips.where(
+        ~has_link,
+        bill_tips + "<br><a href='" + bills["Link"] + "' target='_blank'>Open Link</a>",
+    )
 
-        # We'll convert the date to a short string (YYYY-MM-DD) if available
-        bill_date = row.get("Date", None)
-        if pd.notna(bill_date):
-            date_str = bill_date.strftime("%Y-%m-%d")
-        else:
-            date_str = "N/A"
-
-        # Add Bill node
-        if bill_title not in added_nodes:
-            # Include the date in the tooltip
-            tooltip = f"<b>Bill</b>: {bill_title}<br>Date: {date_str}"
-            if link:
-                tooltip += f"<br><a href='{link}' target='_blank'>Open Link</a>"
-
-            net.add_node(bill_title, label=bill_title, title=tooltip, color="#ffa500")
-            added_nodes.add(bill_title)
-
-        # Add Author node
-        if author and author not in added_nodes:
-            net.add_node(author, label=author, title=f"<b>Author</b>: {author}", color="#1f78b4")
-            added_nodes.add(author)
-
-        # Add Policy node
-        if policy_area and policy_area not in added_nodes:
-            net.add_node(policy_area, label=policy_area,
-                         title=f"<b>Policy Area</b>: {policy_area}", color="#33a02c")
-            added_nodes.add(policy_area)
-
-        # Add edges
-        if author:
-            net.add_edge(author, bill_title, color="#bbbbbb")
-        if policy_area:
-            net.add_edge(bill_title, policy_area, color="#bbbbbb")
+    authors = data.loc[has_author, "Author"].unique()
+    policies = data.loc[has_policy, "Policy Area"].unique()
+    author_edges = data.loc[has_author, ["Author", "Title"]].drop_duplicates().to_numpy()
+    policy_edges = data.loc[has_policy, ["Title", "Policy Area"]].drop_duplicates().to_numpy()
+
+    # Lay the graph out once here (seeded, so reruns look the same) instead of
+    # making the browser run a physics simulation on every render
+    graph = nx.Graph()
+    graph.add_nodes_from(bill_titles)
+    graph.add_nodes_from(authors)
+    graph.add_nodes_from(policies)
+    graph.add_edges_from(author_edges)
+    graph.add_edges_from(policy_edges)
+    if graph.number_of_nodes() <= MAX_LAYOUT_NODES:
+        net.toggle_physics(False)
+        layout = nx.rescale_layout_dict(nx.forceatlas2_layout(graph, max_iter=50, seed=42), scale=1000)
+        pos = {node: (float(x), float(y)) for node, (x, y) in layout.items()}  # JSON-safe floats
+    else:
+        pos = {}  # Too big to lay out here; leave it to the browser's physics
+
+    # Add Bill, Author and Policy nodes, pinned to their precomputed positions.
+    # The option dicts are appended directly in the shape pyvis' add_node()
+    # builds, skipping its per-call validation and list membership checks.
+    font = {"color": net.font_color}
+    node_groups = (
+        (bill_titles, bill_tips, "#ffa500"),
+        (authors, ("<b>Author</b>: " + a for a in authors), "#1f78b4"),
+        (policies, ("<b>Policy Area</b>: " + p for p in policies), "#33a02c"),
+    )
+    for node_ids, tooltips, color in node_groups:
+        for node_id, tooltip in zip(node_ids, tooltips):
+            if node_id in net.node_map:
+                continue  # First group to claim an id keeps it, as in add_node()
+            node = {"color": color, "title": tooltip,
+                    "id": node_id, "label": node_id, "shape": "dot", "font": font}
+            if node_id in pos:
+                node["x"], node["y"] = pos[node_id]
+                node["physics"] = False
+            net.nodes.append(node)
+            net.node_ids.append(node_id)
+            net.node_map[node_id] = node
+
+    # Add edges, deduplicated up front; add_edge() would rescan every existing
+    # edge on each call, so undirected duplicates are tracked in a set instead
+    seen_edges = set()
+    for source, target in (*author_edges, *policy_edges):
+        key = frozenset((source, target))
+        if key in seen_edges:
+            continue
+        seen_edges.add(key)
+        net.edges.append({"color": "#bbbbbb", "from": source, "to": target})
 
     return net
 
-def render_network_graph_with_dblclick(net: Network, data: pd.DataFrame):
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_network_html(data: pd.DataFrame) -> str:
     """
-    Renders the PyVis network graph in Streamlit by generating
-    an HTML file and embedding it via an iframe.
+    Builds the PyVis network graph for `data` and returns its final HTML,
+    with custom JS injected so double-clicking a Bill node opens its link
+    in a new tab.
 
-    Injects custom JS so double-clicking a Bill node opens its link in a new tab.
+    Cached on the graph's input rows, so reruns that don't change the
+    filtered data reuse the generated markup. Each page is several hundred
+    KB, so only the most recent graphs are kept.
     """
-    # 1) Build node->link map for Bill nodes only
-    node_link_map = {}
-    for idx, row in data.iterrows():
-        bill_title = row["Title"]
-        link = row.get("Link", None)
-        if pd.notna(link) and link:
-            node_link_map[bill_title] = link
+    # Untitled rows have no node to attach to (pd.NA isn't a valid node id)
+    data = data[data["Title"].notna()]
+    net = create_network_graph(data)
+
+    # 1) Build node->link map for Bill nodes only (a repeated title keeps the
+    #    link of its latest-dated row, since rows are sorted by Date)
+    has_link = data["Link"].notna() & (data["Link"] != "")
+    node_link_map = dict(zip(data.loc[has_link, "Title"], data.loc[has_link, "Link"]))
 
     # 2) Generate the HTML in memory
-    net.generate_html()
+    html = net.generate_html(notebook=False)
 
     # 3) Inject custom <script> to handle double-click
     custom_js = f"""
@@ -259,59 +533,65 @@ document.addEventListener('DOMContentLoaded', function() {{
 }});
 </script>
 """
-    if net.html is not None:
-        net.html = net.html.replace("</body>", custom_js + "</body>")
-
-    # 4) Write final HTML to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".html") as tmp_file:
-        temp_path = tmp_file.name
-
-    with open(temp_path, "w", encoding="utf-8") as f:
-        f.write(net.html)
+    return html.replace("</body>", custom_js + "</body>")
 
-    # 5) Display in an iframe
-    with open(temp_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
-    components.html(html_content, height=700, scrolling=True)
+def render_network_graph_with_dblclick(data: pd.DataFrame):
+    """
+    Renders the network graph for `data` in Streamlit, embedding the
+    (cached) PyVis HTML via an iframe.
+    """
+    graph_data = data[["Title", "Author", "Policy Area", "Date", "Link"]]
+    components.html(build_network_html(graph_data), height=700, scrolling=True)
 
-def create_sankey_diagram(df: pd.DataFrame):
+@st.cache_data(show_spinner=False, max_entries=16)
+def create_sankey_diagram(df: pd.DataFrame, max_links: int = 200):
     """
     Creates a Sankey diagram with improved styling to reduce clutter.
     It visualizes the flow from Author -> Policy Area -> Enactment Method
     using plotly.graph_objects.
+
+    Only the `max_links` heaviest links are drawn; the long tail is folded
+    into one link per tier pair between synthetic "Other (...)" nodes.
     """
-    authors = sorted(df["Author"].dropna().unique())
-    policies = sorted(df["Policy Area"].dropna().unique())
-    methods = sorted(df["Enactment Method"].dropna().unique())
-
-    labels = list(authors) + list(policies) + list(methods)
-
-    author_indices = {a: i for i, a in enumerate(authors)}
-    policy_indices = {p: i + len(authors) for i, p in enumerate(policies)}
-    method_indices = {
-        m: i + len(authors) + len(policies)
-        for i, m in enumerate(methods)
-    }
-
-    sources = []
-    targets = []
-    values = []
-
-    for _, row in df.iterrows():
-        author = row["Author"]
-        policy = row["Policy Area"]
-        if pd.notna(author) and pd.notna(policy):
-            sources.append(author_indices[author])
-            targets.append(policy_indices[policy])
-            values.append(1)
-
-    for _, row in df.iterrows():
-        policy = row["Policy Area"]
-        method = row["Enactment Method"]
-        if pd.notna(policy) and pd.notna(method):
-            sources.append(policy_indices[policy])
-            targets.append(method_indices[method])
-            values.append(1)
+    tier_names = ["Authors", "Policy Areas", "Methods"]
+
+    # Categorical codes double as node indices (categories are sorted, -1 = missing)
+    authors = pd.Categorical(df["Author"]).remove_unused_categories()
+    policies = pd.Categorical(df["Policy Area"]).remove_unused_categories()
+    methods = pd.Categorical(df["Enactment Method"]).remove_unused_categories()
+
+    labels = list(authors.categories) + list(policies.categories) + list(methods.categories)
+    policy_offset = len(authors.categories)
+    method_offset = policy_offset + len(policies.categories)
+
+    # Collapse duplicate flows into one weighted link per (source, target) pair
+    flows = []
+    for tier, (source_codes, target_codes, source_offset, target_offset) in enumerate((
+        (authors.codes, policies.codes, 0, policy_offset),
+        (policies.codes, methods.codes, policy_offset, method_offset),
+    )):
+        pairs = pd.DataFrame({"source": source_codes, "target": target_codes}, dtype="int64")
+        pairs = pairs[(pairs["source"] >= 0) & (pairs["target"] >= 0)]
+        counts = pairs.groupby(["source", "target"]).size().reset_index(name="value")
+        counts["source"] += source_offset
+        counts["target"] += target_offset
+        counts["tier"] = tier
+        flows.append(counts)
+    links = pd.concat(flows, ignore_index=True)
+
+    # Plotly's Sankey bogs down past a few hundred links: keep the heaviest
+    # ones and sum the rest into a single "Other" link per tier pair
+    if len(links) > max_links:
+        links = links.sort_values("value", ascending=False, kind="stable")
+        tail = links.iloc[max_links:].groupby("tier", as_index=False)["value"].sum()
+        links = links.iloc[:max_links]
+
+        other_tiers = sorted(set(tail["tier"]) | set(tail["tier"] + 1))
+        other_index = {t: len(labels) + i for i, t in enumerate(other_tiers)}
+        labels += [f"Other ({tier_names[t]})" for t in other_tiers]
+        tail["source"] = tail["tier"].map(other_index)
+        tail["target"] = (tail["tier"] + 1).map(other_index)
+        links = pd.concat([links, tail], ignore_index=True)
 
     fig = go.Figure(
         data=[
@@ -326,9 +606,9 @@ def create_sankey_diagram(df: pd.DataFrame):
                     hovertemplate='%{label}<extra></extra>',
                 ),
                 link=dict(
-                    source=sources,
-                    target=targets,
-                    value=values,
+                    source=links["source"],
+                    target=links["target"],
+                    value=links["value"],
                     color="rgba(150,150,150,0.4)",
                     hovertemplate=(
                         'Flow from %{source.label} to %{target.label} '
@@ -348,17 +628,70 @@ def create_sankey_diagram(df: pd.DataFrame):
 
     return fig
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def create_weekly_scatter_plot(df: pd.DataFrame):
+    """
+    Downsampled stand-in for the basic scatter plot on large selections:
+    bills are counted per week, policy area and author, and each group is
+    drawn as one orb sized by its count.
+    """
+    weekly = (
+        df.groupby([pd.Grouper(key="Date", freq="W"), "Policy Area", "Author"], observed=True)
+        .size()
+        .reset_index(name="Bills")
+    )
+    fig = px.scatter(
+        weekly,
+        x="Policy Area",
+        y="Date",
+        color="Author",
+        size="Bills",
+        render_mode="webgl",
+        labels={"Date": "Week Introduced"},
+        title="Policy Area vs. Date (Weekly Counts, Colored by Author)"
+    )
+    fig.update_layout(autosize=True, height=700, margin=dict(l=40, r=40, t=80, b=40))
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=16)
 def create_timeline_plot(df: pd.DataFrame):
     """
     Creates a Plotly timeline showing the bills over time.
     We replicate a timeline by setting Start = Date and End = Date+1 day.
+
+    Above MAX_TIMELINE_BARS bills, one bar per bill is too heavy for the
+    browser, so bills are counted per month and author instead.
     """
-    temp_df = df.copy()
-    temp_df["Start"] = temp_df["Date"]
-    temp_df["End"] = temp_df["Date"] + pd.Timedelta(days=1)
+    if len(df) > MAX_TIMELINE_BARS:
+        monthly = (
+            df.groupby([df["Date"].dt.to_period("M"), "Author"], observed=True)
+            .size()
+            .reset_index(name="Bills")
+        )
+        monthly["Date"] = monthly["Date"].dt.to_timestamp()
+        fig = px.bar(
+            monthly,
+            x="Date",
+            y="Bills",
+            color="Author",
+            title="Bills per Month (Aggregated Timeline)"
+        )
+        fig.update_layout(height=700)
+        return fig
+
+    # Only the columns the timeline reads, rather than a copy of every column
+    plot_df = pd.DataFrame({
+        "Start": df["Date"],
+        "End": df["Date"] + pd.Timedelta(days=1),
+        "Title": df["Title"],
+        "Author": df["Author"],
+        "Policy Area": df["Policy Area"],
+        "Enactment Method": df["Enactment Method"],
+        "Link": df["Link"],
+    })
 
     fig = px.timeline(
-        temp_df,
+        plot_df,
         x_start="Start",
         x_end="End",
         y="Title",
@@ -370,6 +703,71 @@ def create_timeline_plot(df: pd.DataFrame):
     fig.update_layout(height=700)
     return fig
 
+@st.fragment
+def advanced_panel(mtime: float, filtered_data: pd.DataFrame, show_all: bool, options: FilterOptions):
+    """
+    Advanced filters, results table and configurable scatter plot.
+
+    Runs as a fragment: changing a widget in here (axes, text size, the
+    advanced filters) reruns only this panel, not the whole page.
+    """
+    if show_all:
+        st.info("You are currently viewing ALL bills. Advanced filtering won't reduce data.")
+        adv_data = filtered_data
+    else:
+        # Let user choose advanced filters if not showing all
+        advanced_author_filter = st.multiselect("Filter by Author", options=options.authors, default=[])
+        advanced_policy_filter = st.multiselect("Filter by Policy Area", options=options.policy_areas, default=[])
+        advanced_enactment_filter = st.multiselect("Filter by Enactment Method", options=options.methods, default=[])
+        advanced_date_range = st.slider(
+            "Select Date Range",
+            min_value=options.min_date,
+            max_value=options.max_date,
+            value=(options.min_date, options.max_date),
+            key="advanced_date_range",  # the basic filter has a slider with the same label
+        )
+
+        adv_data = slim_frame(
+            apply_filters(
+                mtime,
+                tuple(advanced_author_filter),
+                tuple(advanced_policy_filter),
+                tuple(advanced_enactment_filter),
+                advanced_date_range[0],
+                advanced_date_range[1],
+            ),
+            VIEW_COLUMNS,
+        )
+
+    st.subheader("Advanced Filtered Results")
+    display_results_table(adv_data)
+
+    axis_options = ["Policy Area", "Date", "Author", "Enactment Method"]
+    x_axis = st.selectbox("X-Axis", axis_options, index=0)
+    y_axis = st.selectbox("Y-Axis", axis_options, index=1)
+    color_col = st.selectbox("Color By", axis_options, index=2)
+
+    text_size = st.slider("Text Size in Chart", min_value=10, max_value=30, value=12, step=1)
+    annotate_advanced = st.checkbox(
+        "Show Titles (Clickable) Above Each Orb?",
+        value=True,
+        help=f"Titles are only drawn when {MAX_ANNOTATED_POINTS} or fewer bills are plotted.",
+    )
+
+    if not adv_data.empty:
+        fig_advanced = generate_scatter_plot(
+            data=adv_data,
+            x_col=x_axis,
+            y_col=y_axis,
+            color_col=color_col,
+            title="Advanced Visualization",
+            text_size=text_size,
+            annotate_points=annotate_advanced
+        )
+        st.plotly_chart(fig_advanced, use_container_width=True)
+    else:
+        st.info("No data to visualize in Advanced Mode. Please adjust filters or load all bills.")
+
 # ==========================================
 #       MAIN APP
 # ==========================================
@@ -385,7 +783,7 @@ def main():
 
         This enhanced app includes:
         - **Filters** by Author, Policy, Enactment Method, and Date.
-        - **Network Graph** with physics-based layout (PyVis).  
+        - **Network Graph** with a precomputed force-directed layout (PyVis).  
           (Double-click Bill nodes to open links!)
         - **Scatter & Bar Charts** with advanced mode.
         - **Sankey Diagram** for flow-based analysis.
@@ -401,12 +799,17 @@ def main():
 
     st.title("Enacted Federal Legislation Tracker")
 
-    # 1. Load Data
-    data = get_filtered_data()
+    # 1. Load Data (cached until the spreadsheet changes on disk)
+    mtime = file_mtime(FILE_NAME)
+    data = get_filtered_data(mtime)
     if data.empty:
         st.error("No data available. Please ensure the file is present and correctly formatted.")
         return
 
+    # Widget choices (cached; shared by the basic and advanced filters)
+    filter_options = get_filter_options(mtime)
+    authors, policy_areas, methods, min_date, max_date = filter_options
+
     # 2. "See All" Button for entire dataset
     show_all = st.button("See all bills (Warning: might take a minute to load)")
     if show_all:
@@ -422,12 +825,6 @@ def main():
             index=0
         )
 
-        authors = sorted(data["Author"].dropna().unique())
-        policy_areas = sorted(data["Policy Area"].dropna().unique())
-        methods = sorted(data["Enactment Method"].dropna().unique())
-        min_date = data["Date"].min().date()
-        max_date = data["Date"].max().date()
-
         # If default author exists in dataset, pre-select it
         default_author = [DEFAULT_AUTHOR_NAME] if DEFAULT_AUTHOR_NAME in authors else []
 
@@ -454,16 +851,20 @@ def main():
                 value=(min_date, max_date)
             )
 
-        filtered_data = data[
-            ((data["Author"].isin(author_filter)) | (len(author_filter) == 0)) &
-            ((data["Policy Area"].isin(policy_filter)) | (len(policy_filter) == 0)) &
-            ((data["Enactment Method"].isin(enactment_filter)) | (len(enactment_filter) == 0)) &
-            (data["Date"] >= pd.to_datetime(date_range[0])) &
-            (data["Date"] <= pd.to_datetime(date_range[1]))
-        ]
+        filtered_data = apply_filters(
+            mtime,
+            tuple(author_filter),
+            tuple(policy_filter),
+            tuple(enactment_filter),
+            date_range[0],
+            date_range[1],
+        )
+
+    # Only the columns the views below use, in display order
+    filtered_data = slim_frame(filtered_data, VIEW_COLUMNS)
 
-    # -- PHYSICS GRAPH FIRST --
-    st.subheader("Network Graph (Physics Simulation)")
+    # -- NETWORK GRAPH FIRST --
+    st.subheader("Network Graph")
     st.markdown(
         """
         **Hover over Bill nodes** to see their date.  
@@ -473,12 +874,11 @@ def main():
         - **Bill** nodes (orange)  
         - **Policy Area** nodes (green)
 
-        Drag them around to see the “springs” in action.
+        Drag nodes around to rearrange the layout.
         """
     )
     if not filtered_data.empty:
-        net = create_network_graph(filtered_data)
-        render_network_graph_with_dblclick(net, filtered_data)
+        render_network_graph_with_dblclick(filtered_data)
     else:
         st.info("No data to display in network graph. Adjust your filters or load all bills.")
 
@@ -495,13 +895,28 @@ def main():
             **Click** on a legend entry to hide/show certain series.
             """
         )
-        fig = generate_scatter_plot(
-            data=filtered_data,
-            x_col="Policy Area",
-            y_col="Date",
-            color_col="Author",
-            title="Policy Area vs. Date (Colored by Author)"
-        )
+        plot_every_bill = True
+        if len(filtered_data) > MAX_SCATTER_POINTS:
+            plot_every_bill = st.checkbox(
+                "Plot every bill",
+                value=False,
+                help=f"Above {MAX_SCATTER_POINTS} bills, bills are grouped by week by default.",
+            )
+        if plot_every_bill:
+            if len(filtered_data) > MAX_ANNOTATED_POINTS:
+                st.caption(
+                    f"More than {MAX_ANNOTATED_POINTS} bills selected, so titles aren't drawn "
+                    "above the orbs. Hover an orb to see its bill."
+                )
+            fig = generate_scatter_plot(
+                data=filtered_data,
+                x_col="Policy Area",
+                y_col="Date",
+                color_col="Author",
+                title="Policy Area vs. Date (Colored by Author)"
+            )
+        else:
+            fig = create_weekly_scatter_plot(filtered_data)
         st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("No data to visualize. Please adjust filters or load all bills.")
@@ -509,9 +924,7 @@ def main():
     # -- BAR CHART BY YEAR (Expander) --
     with st.expander("Show Bar Chart by Year", expanded=False):
         if not filtered_data.empty:
-            temp_df = filtered_data.copy()
-            temp_df["Year"] = temp_df["Date"].dt.year
-            year_counts = temp_df.groupby("Year")["Title"].count().reset_index()
+            year_counts = filtered_data.groupby("Year").size().reset_index(name="Title")
             if not year_counts.empty:
                 st.write("Number of Enacted Items per Year")
                 fig_bar = px.bar(
@@ -537,64 +950,19 @@ def main():
             - Adjust font sizes and toggle clickable labels for each orb.
             """
         )
-        if show_all:
-            st.info("You are currently viewing ALL bills. Advanced filtering won't reduce data.")
-            adv_data = filtered_data
-        else:
-            # Let user choose advanced filters if not showing all
-            authors = sorted(data["Author"].dropna().unique())
-            policy_areas = sorted(data["Policy Area"].dropna().unique())
-            methods = sorted(data["Enactment Method"].dropna().unique())
-            min_date = data["Date"].min().date()
-            max_date = data["Date"].max().date()
-
-            advanced_author_filter = st.multiselect("Filter by Author", options=authors, default=[])
-            advanced_policy_filter = st.multiselect("Filter by Policy Area", options=policy_areas, default=[])
-            advanced_enactment_filter = st.multiselect("Filter by Enactment Method", options=methods, default=[])
-            advanced_date_range = st.slider(
-                "Select Date Range",
-                min_value=min_date,
-                max_value=max_date,
-                value=(min_date, max_date)
-            )
-
-            adv_data = data[
-                ((data["Author"].isin(advanced_author_filter)) | (len(advanced_author_filter) == 0)) &
-                ((data["Policy Area"].isin(advanced_policy_filter)) | (len(advanced_policy_filter) == 0)) &
-                ((data["Enactment Method"].isin(advanced_enactment_filter)) | (len(advanced_enactment_filter) == 0)) &
-                (data["Date"] >= pd.to_datetime(advanced_date_range[0])) &
-                (data["Date"] <= pd.to_datetime(advanced_date_range[1]))
-            ]
-
-        st.subheader("Advanced Filtered Results")
-        display_results_table(adv_data)
-
-        axis_options = ["Policy Area", "Date", "Author", "Enactment Method"]
-        x_axis = st.selectbox("X-Axis", axis_options, index=0)
-        y_axis = st.selectbox("Y-Axis", axis_options, index=1)
-        color_col = st.selectbox("Color By", axis_options, index=2)
-
-        text_size = st.slider("Text Size in Chart", min_value=10, max_value=30, value=12, step=1)
-        annotate_advanced = st.checkbox("Show Titles (Clickable) Above Each Orb?", value=True)
-
-        if not adv_data.empty:
-            fig_advanced = generate_scatter_plot(
-                data=adv_data,
-                x_col=x_axis,
-                y_col=y_axis,
-                color_col=color_col,
-                title="Advanced Visualization",
-                text_size=text_size,
-                annotate_points=annotate_advanced
-            )
-            st.plotly_chart(fig_advanced, use_container_width=True)
-        else:
-            st.info("No data to visualize in Advanced Mode. Please adjust filters or load all bills.")
+        advanced_panel(mtime, filtered_data, show_all, filter_options)
 
     # -- SANKEY DIAGRAM --
     with st.expander("Sankey Diagram (Author → Policy Area → Method)"):
         if not filtered_data.empty:
-            fig_sankey = create_sankey_diagram(filtered_data)
+            max_links = st.slider(
+                "Max Sankey links",
+                min_value=50,
+                max_value=500,
+                value=200,
+                help="The heaviest links are kept; the rest are grouped into 'Other' nodes.",
+            )
+            fig_sankey = create_sankey_diagram(filtered_data, max_links=max_links)
             st.plotly_chart(fig_sankey, use_container_width=True)
         else:
             st.info("No data to display for Sankey. Adjust your filters or load all bills.")
@@ -602,6 +970,11 @@ def main():
     # -- TIMELINE VIEW --
     with st.expander("Timeline View"):
         if not filtered_data.empty:
+            if len(filtered_data) > MAX_TIMELINE_BARS:
+                st.caption(
+                    f"More than {MAX_TIMELINE_BARS} bills selected, so the timeline shows "
+                    "monthly counts. Narrow your filters to see individual bills."
+                )
             fig_timeline = create_timeline_plot(filtered_data)
             st.plotly_chart(fig_timeline, use_container_width=True)
         else: